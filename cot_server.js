@@ -1,7 +1,7 @@
 #!/usr/bin/env node
 const fs = require('fs');
 const path = require('path');
-const readline = require('readline');
+const { listen, sendResponse, serializeResult, sendStaticResponse } = require('./stdio_jsonrpc.js');
 
 // Data storage paths
 const DATA_DIR = path.join(__dirname, 'data');
@@ -35,241 +35,215 @@ function saveCotStrands(strands) {
 }
 
 // MCP Protocol Handler
-const rl = readline.createInterface({
-  input: process.stdin,
-  output: process.stdout,
-  terminal: false
-});
+listen(handleLine);
+
+function handleLine(line) {
+  if (!line) return;
 
-rl.on('line', (line) => {
   try {
-    const trimmed = line.trim();
-    if (!trimmed) return;
-    
-    const request = JSON.parse(trimmed);
-    handleRequest(request);
+    // JSON.parse tolerates surrounding whitespace, so no trimmed copy is needed
+    handleRequest(JSON.parse(line));
   } catch (e) {
     if (line.trim()) {
       process.stderr.write(`Parse error: ${e.message}\n`);
     }
   }
-});
+}
+
+const REQUEST_HANDLERS = new Map([
+  ['initialize', handleInitialize],
+  ['tools/list', handleToolsList],
+  ['tools/call', handleToolCall],
+  ['resources/list', handleResourcesList]
+]);
 
 function handleRequest(request) {
-  switch (request.method) {
-    case 'initialize':
-      handleInitialize(request);
-      break;
-    case 'tools/list':
-      handleToolsList(request);
-      break;
-    case 'tools/call':
-      handleToolCall(request);
-      break;
-    case 'resources/list':
-      handleResourcesList(request);
-      break;
-    default:
-      sendError(request.id || 0, -32601, 'Method not found');
+  const handler = REQUEST_HANDLERS.get(request.method);
+  if (handler) {
+    handler(request);
+  } else {
+    sendError(request.id || 0, -32601, 'Method not found');
   }
 }
 
-function handleInitialize(request) {
-  const response = {
-    jsonrpc: "2.0",
-    id: request.id,
-    result: {
-      protocolVersion: "2024-11-05",
-      capabilities: {
-        tools: {}
+const TOOLS = [
+  {
+    name: "create_cot_strand",
+    description: "Create new Chain of Thought reasoning strand",
+    inputSchema: {
+      type: "object",
+      properties: {
+        topic: {
+          type: "string",
+          description: "Topic or problem being analyzed"
+        },
+        initial_thought: {
+          type: "string",
+          description: "Initial reasoning step"
+        }
       },
-      serverInfo: {
-        name: "cot-server",
-        version: "1.0.0"
-      }
-    }
-  };
-  console.log(JSON.stringify(response));
-}
-
-function handleResourcesList(request) {
-  const response = {
-    jsonrpc: "2.0",
-    id: request.id,
-    result: {
-      resources: []
+      required: ["topic", "initial_thought"]
     }
-  };
-  console.log(JSON.stringify(response));
-}
-
-function handleToolsList(request) {
-  const tools = [
-    {
-      name: "create_cot_strand",
-      description: "Create new Chain of Thought reasoning strand",
-      inputSchema: {
-        type: "object",
-        properties: {
-          topic: {
-            type: "string",
-            description: "Topic or problem being analyzed"
-          },
-          initial_thought: {
-            type: "string",
-            description: "Initial reasoning step"
-          }
+  },
+  {
+    name: "add_to_strand",
+    description: "Add reasoning step to existing CoT strand",
+    inputSchema: {
+      type: "object",
+      properties: {
+        strand_id: {
+          type: "string",
+          description: "ID of the strand to extend"
         },
-        required: ["topic", "initial_thought"]
-      }
-    },
-    {
-      name: "add_to_strand",
-      description: "Add reasoning step to existing CoT strand",
-      inputSchema: {
-        type: "object",
-        properties: {
-          strand_id: {
-            type: "string",
-            description: "ID of the strand to extend"
-          },
-          thought: {
-            type: "string",
-            description: "Next reasoning step"
-          }
+        thought: {
+          type: "string",
+          description: "Next reasoning step"
+        }
+      },
+      required: ["strand_id", "thought"]
+    }
+  },
+  {
+    name: "get_strand",
+    description: "Retrieve specific CoT strand",
+    inputSchema: {
+      type: "object",
+      properties: {
+        strand_id: {
+          type: "string",
+          description: "ID of strand to retrieve"
+        }
+      },
+      required: ["strand_id"]
+    }
+  },
+  {
+    name: "complete_strand",
+    description: "Mark CoT strand as completed with conclusion",
+    inputSchema: {
+      type: "object",
+      properties: {
+        strand_id: {
+          type: "string",
+          description: "ID of strand to complete"
         },
-        required: ["strand_id", "thought"]
-      }
-    },
-    {
-      name: "get_strand",
-      description: "Retrieve specific CoT strand",
-      inputSchema: {
-        type: "object",
-        properties: {
-          strand_id: {
-            type: "string",
-            description: "ID of strand to retrieve"
-          }
+        conclusion: {
+          type: "string",
+          description: "Final conclusion or result"
+        }
+      },
+      required: ["strand_id", "conclusion"]
+    }
+  },
+  {
+    name: "list_strands",
+    description: "List all CoT strands with optional filters",
+    inputSchema: {
+      type: "object",
+      properties: {
+        limit: {
+          type: "number",
+          description: "Maximum number of strands to return (default: 20)"
         },
-        required: ["strand_id"]
+        status: {
+          type: "string",
+          enum: ["active", "completed", "all"],
+          description: "Filter by strand status (default: all)"
+        }
       }
-    },
-    {
-      name: "complete_strand",
-      description: "Mark CoT strand as completed with conclusion",
-      inputSchema: {
-        type: "object",
-        properties: {
-          strand_id: {
-            type: "string",
-            description: "ID of strand to complete"
-          },
-          conclusion: {
-            type: "string",
-            description: "Final conclusion or result"
-          }
+    }
+  },
+  {
+    name: "search_strands",
+    description: "Search CoT strands by topic or content keywords",
+    inputSchema: {
+      type: "object",
+      properties: {
+        query: {
+          type: "string",
+          description: "Search query for topics and content"
         },
-        required: ["strand_id", "conclusion"]
-      }
-    },
-    {
-      name: "list_strands",
-      description: "List all CoT strands with optional filters",
-      inputSchema: {
-        type: "object",
-        properties: {
-          limit: {
-            type: "number",
-            description: "Maximum number of strands to return (default: 20)"
-          },
-          status: {
-            type: "string",
-            enum: ["active", "completed", "all"],
-            description: "Filter by strand status (default: all)"
-          }
+        limit: {
+          type: "number",
+          description: "Maximum results to return (default: 10)"
         }
-      }
-    },
-    {
-      name: "search_strands",
-      description: "Search CoT strands by topic or content keywords",
-      inputSchema: {
-        type: "object",
-        properties: {
-          query: {
-            type: "string",
-            description: "Search query for topics and content"
-          },
-          limit: {
-            type: "number",
-            description: "Maximum results to return (default: 10)"
-          }
+      },
+      required: ["query"]
+    }
+  },
+  {
+    name: "branch_strand",
+    description: "Create new reasoning branch from existing strand",
+    inputSchema: {
+      type: "object",
+      properties: {
+        source_strand_id: {
+          type: "string",
+          description: "ID of strand to branch from"
         },
-        required: ["query"]
-      }
-    },
-    {
-      name: "branch_strand",
-      description: "Create new reasoning branch from existing strand",
-      inputSchema: {
-        type: "object",
-        properties: {
-          source_strand_id: {
-            type: "string",
-            description: "ID of strand to branch from"
-          },
-          branch_topic: {
-            type: "string",
-            description: "Topic for the new branch"
-          },
-          branch_thought: {
-            type: "string",
-            description: "Initial thought for the branch"
-          }
+        branch_topic: {
+          type: "string",
+          description: "Topic for the new branch"
         },
-        required: ["source_strand_id", "branch_topic", "branch_thought"]
-      }
+        branch_thought: {
+          type: "string",
+          description: "Initial thought for the branch"
+        }
+      },
+      required: ["source_strand_id", "branch_topic", "branch_thought"]
     }
-  ];
+  }
+];
 
-  const response = {
-    jsonrpc: "2.0",
-    id: request.id,
-    result: {
-      tools: tools
-    }
-  };
-  console.log(JSON.stringify(response));
+const INITIALIZE_RESULT = serializeResult({
+  protocolVersion: "2024-11-05",
+  capabilities: {
+    tools: {}
+  },
+  serverInfo: {
+    name: "cot-server",
+    version: "1.0.0"
+  }
+});
+
+const RESOURCES_LIST_RESULT = serializeResult({
+  resources: []
+});
+
+const TOOLS_LIST_RESULT = serializeResult({
+  tools: TOOLS
+});
+
+function handleInitialize(request) {
+  sendStaticResponse(request.id, INITIALIZE_RESULT);
 }
 
+function handleResourcesList(request) {
+  sendStaticResponse(request.id, RESOURCES_LIST_RESULT);
+}
+
+function handleToolsList(request) {
+  sendStaticResponse(request.id, TOOLS_LIST_RESULT);
+}
+
+const TOOL_HANDLERS = new Map([
+  ['create_cot_strand', handleCreateCotStrand],
+  ['add_to_strand', handleAddToStrand],
+  ['get_strand', handleGetStrand],
+  ['list_strands', handleListStrands],
+  ['search_strands', handleSearchStrands],
+  ['complete_strand', handleCompleteStrand],
+  ['branch_strand', handleBranchStrand]
+]);
+
 function handleToolCall(request) {
   const { name, arguments: args } = request.params;
   
-  switch (name) {
-    case 'create_cot_strand':
-      handleCreateCotStrand(request, args);
-      break;
-    case 'add_to_strand':
-      handleAddToStrand(request, args);
-      break;
-    case 'get_strand':
-      handleGetStrand(request, args);
-      break;
-    case 'list_strands':
-      handleListStrands(request, args);
-      break;
-    case 'search_strands':
-      handleSearchStrands(request, args);
-      break;
-    case 'complete_strand':
-      handleCompleteStrand(request, args);
-      break;
-    case 'branch_strand':
-      handleBranchStrand(request, args);
-      break;
-    default:
-      sendError(request.id, -32601, 'Tool not found');
+  const handler = TOOL_HANDLERS.get(name);
+  if (handler) {
+    handler(request, args);
+  } else {
+    sendError(request.id, -32601, 'Tool not found');
   }
 }
 
@@ -302,7 +276,7 @@ function handleCreateCotStrand(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleAddToStrand(request, args) {
@@ -333,7 +307,7 @@ function handleAddToStrand(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleGetStrand(request, args) {
@@ -359,7 +333,7 @@ function handleGetStrand(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleListStrands(request) {
@@ -397,7 +371,7 @@ function handleListStrands(request) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleCompleteStrand(request, args) {
@@ -431,7 +405,7 @@ function handleCompleteStrand(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleBranchStrand(request, args) {
@@ -471,7 +445,7 @@ function handleBranchStrand(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function handleSearchStrands(request, args) {
@@ -548,7 +522,7 @@ function handleSearchStrands(request, args) {
       ]
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function sendError(id, code, message) {
@@ -560,9 +534,11 @@ function sendError(id, code, message) {
       message: message
     }
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
-process.stderr.write('CoT Server v1.0 started\n');
-process.stderr.write('Chain of Thought reasoning tools active\n');
-process.stderr.write(`Data directory: ${DATA_DIR}\n`);
+process.stderr.write(
+  'CoT Server v1.0 started\n' +
+  'Chain of Thought reasoning tools active\n' +
+  `Data directory: ${DATA_DIR}\n`
+);
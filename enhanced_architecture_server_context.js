@@ -6,7 +6,7 @@
 
 const fs = require('fs');
 const path = require('path');
-const readline = require('readline');
+const { listen, sendResponse, serializeResult, sendStaticResponse } = require('./stdio_jsonrpc.js');
 const { SmartMemoryGates, smartMemoryGates } = require('./smart_memory_gates.js');
 
 // Data storage
@@ -296,21 +296,20 @@ function logViolation(type, details) {
 }
 
 // MCP Protocol Handler
-const rl = readline.createInterface({
-  input: process.stdin,
-  output: process.stdout,
-  terminal: false
-});
+listen(handleLine);
+
+// Shared by every tool that takes no arguments
+const EMPTY_SCHEMA = {
+  type: "object",
+  properties: {},
+  required: []
+};
 
 const tools = [
   {
     name: "architecture_status",
     description: "Get current architecture status and capabilities",
-    inputSchema: {
-      type: "object",
-      properties: {},
-      required: []
-    }
+    inputSchema: EMPTY_SCHEMA
   },
   {
     name: "track_context_tokens",
@@ -327,20 +326,12 @@ const tools = [
   {
     name: "get_context_status",
     description: "Get current context token status and remaining capacity",
-    inputSchema: {
-      type: "object",
-      properties: {},
-      required: []
-    }
+    inputSchema: EMPTY_SCHEMA
   },
   {
     name: "reset_context",
     description: "Reset context tracking for new conversation",
-    inputSchema: {
-      type: "object",
-      properties: {},
-      required: []
-    }
+    inputSchema: EMPTY_SCHEMA
   },
   {
     name: "add_pattern",
@@ -357,11 +348,7 @@ const tools = [
   {
     name: "get_user_preferences",
     description: "Retrieve stored user preferences and patterns",
-    inputSchema: {
-      type: "object",
-      properties: {},
-      required: []
-    }
+    inputSchema: EMPTY_SCHEMA
   },
   {
     name: "enforce_tool_safety",
@@ -402,42 +389,85 @@ const tools = [
   }
 ];
 
-rl.on('line', (line) => {
+const INITIALIZE_RESULT = serializeResult({
+  protocolVersion: "2024-11-05",
+  capabilities: { tools: {} },
+  serverInfo: { 
+    name: "enhanced-architecture-server", 
+    version: "operational-context-monitoring",
+    description: "Enhanced Architecture with Professional Accuracy + Tool Safety + User Preferences + Context Token Monitoring"
+  }
+});
+
+const TOOLS_LIST_RESULT = serializeResult({ tools: tools });
+
+function handleLine(line) {
   try {
-    const request = JSON.parse(line);
-    
-    if (request.method === 'initialize') {
-      const response = {
-        jsonrpc: "2.0",
-        id: request.id,
-        result: {
-          protocolVersion: "2024-11-05",
-          capabilities: { tools: {} },
-          serverInfo: { 
-            name: "enhanced-architecture-server", 
-            version: "operational-context-monitoring",
-            description: "Enhanced Architecture with Professional Accuracy + Tool Safety + User Preferences + Context Token Monitoring"
-          }
-        }
-      };
-      console.log(JSON.stringify(response));
-      
-    } else if (request.method === 'tools/list') {
-      const response = {
-        jsonrpc: "2.0",
-        id: request.id,
-        result: { tools: tools }
-      };
-      console.log(JSON.stringify(response));
-      
-    } else if (request.method === 'tools/call') {
-      const { name, arguments: args } = request.params;
-      handleToolCall(name, args, request.id);
-    }
+    handleRequest(JSON.parse(line));
   } catch (e) {
     console.error('Parse error:', e.message);
   }
-});
+}
+
+const REQUEST_HANDLERS = new Map([
+  ['initialize', (request) => sendStaticResponse(request.id, INITIALIZE_RESULT)],
+  ['tools/list', (request) => sendStaticResponse(request.id, TOOLS_LIST_RESULT)],
+  ['tools/call', (request) => {
+    const { name, arguments: args } = request.params;
+    handleToolCall(name, args, request.id);
+  }]
+]);
+
+function handleRequest(request) {
+  const handler = REQUEST_HANDLERS.get(request.method);
+  if (handler) {
+    handler(request);
+  }
+}
+
+// Fixed tool results are built once and shared; they are only ever serialized
+const TOOL_NOT_FOUND_RESULT = { content: [{ type: "text", text: "Tool not found" }] };
+
+const PROHIBITED_TOOL_RESULT = {
+  content: [{
+    type: "text",
+    text: "⛔ TOOL SAFETY VIOLATION: read_multiple_files is COMPLETELY PROHIBITED. Use sequential read_file calls instead."
+  }]
+};
+
+const EMPTY_PATHS_RESULT = {
+  content: [{
+    type: "text",
+    text: "⛔ PARAMETER VALIDATION FAILED: Empty array parameters not allowed. Provide valid file paths."
+  }]
+};
+
+const ACCURACY_PASSED_RESULT = {
+  content: [{
+    type: "text",
+    text: "✅ Professional accuracy check passed - content is factual and appropriate"
+  }]
+};
+
+const TOOL_HANDLERS = new Map([
+  ['architecture_status', getArchitectureStatus],
+  ['track_context_tokens', (args) => trackContextTokens(args.inputTokens, args.responseTokens)],
+  ['get_context_status', getContextStatus],
+  ['reset_context', resetContext],
+  ['add_pattern', (args) => {
+    const result = addPattern(args.pattern_type, args.pattern_data);
+    updateMetrics('pattern_storage');
+    return result;
+  }],
+  ['get_user_preferences', getUserPreferences],
+  ['enforce_tool_safety', (args) => enforceToolSafety(args.tool_name, args.parameters)],
+  ['verify_professional_accuracy', (args) => verifyProfessionalAccuracy(args.content, args.content_type)],
+  ['update_user_preferences', (args) => {
+    const result = updateUserPreferences(args.preference_type, args.preference_value, args.context);
+    updateMetrics('preference_update');
+    return result;
+  }]
+]);
 
 function handleToolCall(name, args, requestId) {
   const startTime = Date.now();
@@ -446,38 +476,11 @@ function handleToolCall(name, args, requestId) {
   // Update metrics for all tool calls
   updateMetrics('general', {});
   
-  switch (name) {
-    case 'architecture_status':
-      result = getArchitectureStatus();
-      break;
-    case 'track_context_tokens':
-      result = trackContextTokens(args.inputTokens, args.responseTokens);
-      break;
-    case 'get_context_status':
-      result = getContextStatus();
-      break;
-    case 'reset_context':
-      result = resetContext();
-      break;
-    case 'add_pattern':
-      result = addPattern(args.pattern_type, args.pattern_data);
-      updateMetrics('pattern_storage');
-      break;
-    case 'get_user_preferences':
-      result = getUserPreferences();
-      break;
-    case 'enforce_tool_safety':
-      result = enforceToolSafety(args.tool_name, args.parameters);
-      break;
-    case 'verify_professional_accuracy':
-      result = verifyProfessionalAccuracy(args.content, args.content_type);
-      break;
-    case 'update_user_preferences':
-      result = updateUserPreferences(args.preference_type, args.preference_value, args.context);
-      updateMetrics('preference_update');
-      break;
-    default:
-      result = { content: [{ type: "text", text: "Tool not found" }] };
+  const handler = TOOL_HANDLERS.get(name);
+  if (handler) {
+    result = handler(args);
+  } else {
+    result = TOOL_NOT_FOUND_RESULT;
   }
   
   // Track response time
@@ -489,7 +492,7 @@ function handleToolCall(name, args, requestId) {
     id: requestId,
     result: result
   };
-  console.log(JSON.stringify(response));
+  sendResponse(response);
 }
 
 function getArchitectureStatus() {
@@ -598,31 +601,31 @@ function addPattern(pattern_type, pattern_data) {
   };
 }
 
+// Core preferences with readable names
+const PREFERENCE_NAMES = {
+  communication_style: 'Communication',
+  aesthetic_approach: 'Aesthetic', 
+  development_location: 'Development',
+  command_preference: 'Commands',
+  accuracy_requirement: 'Accuracy',
+  accuracy_requirements: 'Accuracy',
+  monitoring: 'Monitoring',
+  unicode_usage: 'Unicode',
+  search_strategy: 'Search',
+  tool_safety: 'Tool Safety',
+  message_format: 'Message Format'
+};
+
 function getUserPreferences() {
   const preferences = loadPreferences();
   
   // Dynamically build preference display from all stored preferences
   const prefEntries = [];
   
-  // Core preferences with readable names
-  const preferenceNames = {
-    communication_style: 'Communication',
-    aesthetic_approach: 'Aesthetic', 
-    development_location: 'Development',
-    command_preference: 'Commands',
-    accuracy_requirement: 'Accuracy',
-    accuracy_requirements: 'Accuracy',
-    monitoring: 'Monitoring',
-    unicode_usage: 'Unicode',
-    search_strategy: 'Search',
-    tool_safety: 'Tool Safety',
-    message_format: 'Message Format'
-  };
-  
   // Add all preferences from file
   for (const [key, value] of Object.entries(preferences)) {
     if (key !== 'last_updated') {
-      const displayName = preferenceNames[key] || key.replace(/_/g, ' ');
+      const displayName = PREFERENCE_NAMES[key] || key.replace(/_/g, ' ');
       const displayValue = typeof value === 'string' ? 
         value.replace(/_/g, ' ').replace(/([a-z])([A-Z])/g, '$1 $2') : 
         String(value);
@@ -647,12 +650,7 @@ function enforceToolSafety(tool_name, parameters) {
       reason: 'Completely prohibited tool'
     });
     
-    return {
-      content: [{
-        type: "text",
-        text: "⛔ TOOL SAFETY VIOLATION: read_multiple_files is COMPLETELY PROHIBITED. Use sequential read_file calls instead."
-      }]
-    };
+    return PROHIBITED_TOOL_RESULT;
   }
   
   if (parameters && Array.isArray(parameters.paths) && parameters.paths.length === 0) {
@@ -663,12 +661,7 @@ function enforceToolSafety(tool_name, parameters) {
       reason: 'Empty array parameter'
     });
     
-    return {
-      content: [{
-        type: "text",
-        text: "⛔ PARAMETER VALIDATION FAILED: Empty array parameters not allowed. Provide valid file paths."
-      }]
-    };
+    return EMPTY_PATHS_RESULT;
   }
   
   return {
@@ -679,23 +672,25 @@ function enforceToolSafety(tool_name, parameters) {
   };
 }
 
+const MARKETING_TERMS = [
+  'ultra-low', 'industry-leading', 'revolutionary', 'cutting-edge',
+  'best-in-class', 'breakthrough', 'amazing', 'incredible'
+];
+
+const COMPETITOR_TERMS = ['like span', 'similar to', 'competes with', 'alternative to'];
+
 function verifyProfessionalAccuracy(content, content_type = 'general') {
   const violations = [];
   
-  const marketingTerms = [
-    'ultra-low', 'industry-leading', 'revolutionary', 'cutting-edge',
-    'best-in-class', 'breakthrough', 'amazing', 'incredible'
-  ];
-  
   const lowerContent = content.toLowerCase();
-  marketingTerms.forEach(term => {
+  
+  MARKETING_TERMS.forEach(term => {
     if (lowerContent.includes(term)) {
       violations.push(`Marketing language detected: "${term}"`);
     }
   });
   
-  const competitorTerms = ['like span', 'similar to', 'competes with', 'alternative to'];
-  competitorTerms.forEach(term => {
+  COMPETITOR_TERMS.forEach(term => {
     if (lowerContent.includes(term)) {
       violations.push(`Competitor reference detected: "${term}"`);
     }
@@ -724,12 +719,7 @@ Convert to factual descriptions without marketing language or competitor referen
     };
   }
   
-  return {
-    content: [{
-      type: "text",
-      text: "✅ Professional accuracy check passed - content is factual and appropriate"
-    }]
-  };
+  return ACCURACY_PASSED_RESULT;
 }
 
 function updateUserPreferences(preference_type, preference_value, context) {
@@ -802,6 +792,8 @@ function updateUserPreferences(preference_type, preference_value, context) {
   };
 }
 
-console.error('Enhanced Architecture MCP Server with Context Monitoring started');
-console.error('Professional Accuracy + Tool Safety + User Preferences + Context Tracking active');
-console.error('Smart Memory Gates 63-67 integrated with filtering protocols');
\ No newline at end of file
+process.stderr.write(
+  'Enhanced Architecture MCP Server with Context Monitoring started\n' +
+  'Professional Accuracy + Tool Safety + User Preferences + Context Tracking active\n' +
+  'Smart Memory Gates 63-67 integrated with filtering protocols\n'
+);
\ No newline at end of file
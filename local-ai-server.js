@@ -6,7 +6,114 @@ const {
   CallToolRequestSchema,
   ListToolsRequestSchema,
 } = require('@modelcontextprotocol/sdk/types.js');
-const http = require('http');
+
+// Tool definitions are built once and returned as-is from every tools/list
+const TOOLS = [
+  {
+    name: 'query_local_ai',
+    description: 'Query local AI model via Ollama for reasoning assistance',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        prompt: {
+          type: 'string',
+          description: 'The reasoning prompt to send to local AI'
+        },
+        model: {
+          type: 'string',
+          description: 'Model name (default: architecture-reasoning:latest)',
+          default: 'architecture-reasoning:latest'
+        },
+        temperature: {
+          type: 'number',
+          description: 'Temperature for response (0.1-1.0)',
+          default: 0.6
+        }
+      },
+      required: ['prompt']
+    }
+  },
+  {
+    name: 'reasoning_assist',
+    description: 'Structured reasoning assistance for complex problems',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        problem: {
+          type: 'string',
+          description: 'Problem statement requiring reasoning'
+        },
+        steps: {
+          type: 'number',
+          description: 'Number of reasoning steps requested',
+          default: 5
+        },
+        model: {
+          type: 'string',
+          description: 'Model to use for reasoning',
+          default: 'architecture-reasoning:latest'
+        }
+      },
+      required: ['problem']
+    }
+  },
+  {
+    name: 'model_list',
+    description: 'List available local AI models',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+      required: []
+    }
+  },
+  {
+    name: 'hybrid_analysis',
+    description: 'Hybrid local+cloud analysis for complex data',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        data: {
+          type: 'string',
+          description: 'Data to analyze'
+        },
+        approach: {
+          type: 'string',
+          description: 'Analysis approach: reasoning, technical, creative',
+          default: 'reasoning'
+        },
+        model: {
+          type: 'string',
+          description: 'Local model for analysis',
+          default: 'architecture-reasoning:latest'
+        }
+      },
+      required: ['data']
+    }
+  },
+  {
+    name: 'token_efficient_reasoning',
+    description: 'Delegate heavy reasoning to local AI to conserve cloud tokens',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        reasoning_task: {
+          type: 'string',
+          description: 'Complex reasoning task to delegate'
+        },
+        context: {
+          type: 'string',
+          description: 'Additional context for reasoning'
+        },
+        model: {
+          type: 'string',
+          description: 'Local model for reasoning',
+          default: 'architecture-reasoning:latest'
+        }
+      },
+      required: ['reasoning_task']
+    }
+  }
+];
 
 class LocalAIServer {
   constructor() {
@@ -28,114 +135,7 @@ class LocalAIServer {
 
   setupToolHandlers() {
     this.server.setRequestHandler(ListToolsRequestSchema, async () => {
-      return {
-        tools: [
-          {
-            name: 'query_local_ai',
-            description: 'Query local AI model via Ollama for reasoning assistance',
-            inputSchema: {
-              type: 'object',
-              properties: {
-                prompt: {
-                  type: 'string',
-                  description: 'The reasoning prompt to send to local AI'
-                },
-                model: {
-                  type: 'string',
-                  description: 'Model name (default: architecture-reasoning:latest)',
-                  default: 'architecture-reasoning:latest'
-                },
-                temperature: {
-                  type: 'number',
-                  description: 'Temperature for response (0.1-1.0)',
-                  default: 0.6
-                }
-              },
-              required: ['prompt']
-            }
-          },
-          {
-            name: 'reasoning_assist',
-            description: 'Structured reasoning assistance for complex problems',
-            inputSchema: {
-              type: 'object',
-              properties: {
-                problem: {
-                  type: 'string',
-                  description: 'Problem statement requiring reasoning'
-                },
-                steps: {
-                  type: 'number',
-                  description: 'Number of reasoning steps requested',
-                  default: 5
-                },
-                model: {
-                  type: 'string',
-                  description: 'Model to use for reasoning',
-                  default: 'architecture-reasoning:latest'
-                }
-              },
-              required: ['problem']
-            }
-          },
-          {
-            name: 'model_list',
-            description: 'List available local AI models',
-            inputSchema: {
-              type: 'object',
-              properties: {},
-              required: []
-            }
-          },
-          {
-            name: 'hybrid_analysis',
-            description: 'Hybrid local+cloud analysis for complex data',
-            inputSchema: {
-              type: 'object',
-              properties: {
-                data: {
-                  type: 'string',
-                  description: 'Data to analyze'
-                },
-                approach: {
-                  type: 'string',
-                  description: 'Analysis approach: reasoning, technical, creative',
-                  default: 'reasoning'
-                },
-                model: {
-                  type: 'string',
-                  description: 'Local model for analysis',
-                  default: 'architecture-reasoning:latest'
-                }
-              },
-              required: ['data']
-            }
-          },
-          {
-            name: 'token_efficient_reasoning',
-            description: 'Delegate heavy reasoning to local AI to conserve cloud tokens',
-            inputSchema: {
-              type: 'object',
-              properties: {
-                reasoning_task: {
-                  type: 'string',
-                  description: 'Complex reasoning task to delegate'
-                },
-                context: {
-                  type: 'string',
-                  description: 'Additional context for reasoning'
-                },
-                model: {
-                  type: 'string',
-                  description: 'Local model for reasoning',
-                  default: 'architecture-reasoning:latest'
-                }
-              },
-              required: ['reasoning_task']
-            }
-          }
-        ]
-      };
+      return { tools: TOOLS };
     });
 
     this.server.setRequestHandler(CallToolRequestSchema, async (request) => {
@@ -211,7 +211,9 @@ class LocalAIServer {
     }
   }
 
-  async reasoningAssist(problem, steps = 5, model = 'architecture-reasoning:latest') {
+  // Prompt builders hand back queryLocalAI's promise directly rather than
+  // wrapping it in another async frame
+  reasoningAssist(problem, steps = 5, model = 'architecture-reasoning:latest') {
     const structuredPrompt = `Problem: ${problem}
 
 Please provide a structured reasoning approach with exactly ${steps} steps:
@@ -227,7 +229,7 @@ Conclusion: [Final reasoning conclusion]
 
 Think step by step and show your reasoning process clearly.`;
 
-    return await this.queryLocalAI(structuredPrompt, model, 0.6);
+    return this.queryLocalAI(structuredPrompt, model, 0.6);
   }
 
   async getModelList() {
@@ -258,7 +260,7 @@ Think step by step and show your reasoning process clearly.`;
     }
   }
 
-  async hybridAnalysis(data, approach = 'reasoning', model = 'architecture-reasoning:latest') {
+  hybridAnalysis(data, approach = 'reasoning', model = 'architecture-reasoning:latest') {
     const analysisPrompts = {
       reasoning: `Analyze this data using logical reasoning and chain of thought:
 
@@ -301,10 +303,10 @@ Focus on creativity and innovation.`
     };
 
     const prompt = analysisPrompts[approach] || analysisPrompts.reasoning;
-    return await this.queryLocalAI(prompt, model, 0.7);
+    return this.queryLocalAI(prompt, model, 0.7);
   }
 
-  async tokenEfficientReasoning(reasoningTask, context = '', model = 'architecture-reasoning:latest') {
+  tokenEfficientReasoning(reasoningTask, context = '', model = 'architecture-reasoning:latest') {
     const efficientPrompt = `REASONING DELEGATION TASK:
 
 Task: ${reasoningTask}
@@ -334,7 +336,7 @@ Please provide comprehensive reasoning analysis including:
 
 Optimize for thorough reasoning while being concise in presentation.`;
 
-    return await this.queryLocalAI(efficientPrompt, model, 0.6);
+    return this.queryLocalAI(efficientPrompt, model, 0.6);
   }
 
   formatBytes(bytes) {
@@ -6,7 +6,6 @@
 
 const fs = require('fs');
 const path = require('path');
-const readline = require('readline');
 
 // Data storage
 const DATA_DIR = path.join(__dirname, 'data');
@@ -17,6 +16,15 @@ const METRICS_FILE = path.join(DATA_DIR, 'metrics.json');
 const CONTEXT_FILE = path.join(DATA_DIR, 'context_tracking.json');
 const MEMORY_CACHE_FILE = path.join(DATA_DIR, 'memory_cache.json');
 
+// Lookup tables shared by every gate call
+const STOP_WORDS = new Set(['the', 'is', 'at', 'which', 'on', 'and', 'or', 'but', 'in', 'with', 'to', 'for', 'of', 'as', 'by']);
+
+const RELATED_PREFERENCES = {
+  'english_correction': ['communication_style', 'accuracy_requirements'],
+  'communication_style': ['english_correction', 'message_format'],
+  'accuracy_requirements': ['english_correction', 'professional_accuracy']
+};
+
 // Smart Memory Integration Gates
 class SmartMemoryGates {
   constructor() {
@@ -85,11 +93,10 @@ class SmartMemoryGates {
 
   // Core filtering algorithm
   extractKeywords(text, maxKeywords = 3) {
-    const stopWords = ['the', 'is', 'at', 'which', 'on', 'and', 'or', 'but', 'in', 'with', 'to', 'for', 'of', 'as', 'by'];
     const words = text.toLowerCase()
       .replace(/[^\w\s]/g, ' ')
       .split(/\s+/)
-      .filter(word => word.length > 2 && !stopWords.includes(word));
+      .filter(word => word.length > 2 && !STOP_WORDS.has(word));
     
     // Simple frequency-based keyword extraction
     const frequency = {};
@@ -163,13 +170,7 @@ class SmartMemoryGates {
   }
 
   getRelatedPreferences(preferenceType) {
-    const relationMap = {
-      'english_correction': ['communication_style', 'accuracy_requirements'],
-      'communication_style': ['english_correction', 'message_format'],
-      'accuracy_requirements': ['english_correction', 'professional_accuracy']
-    };
-    
-    return relationMap[preferenceType] || [];
+    return RELATED_PREFERENCES[preferenceType] || [];
   }
 
   isConflicting(newValue, existingValue) {
@@ -213,5 +214,7 @@ module.exports = {
   smartMemoryGates
 };
 
-console.error('Enhanced Architecture MCP Server with Smart Memory Gates started');
-console.error('Memory Integration Gates 63-67 active with smart filtering protocols');
+process.stderr.write(
+  'Enhanced Architecture MCP Server with Smart Memory Gates started\n' +
+  'Memory Integration Gates 63-67 active with smart filtering protocols\n'
+);
@@ -0,0 +1,85 @@
+/**
+ * Stdio JSON-RPC Transport
+ * Newline-delimited message framing and response writing shared by the hand-rolled MCP servers
+ */
+
+const stdin = process.stdin;
+const stdout = process.stdout;
+
+// While a stdin chunk is being handled, responses are appended to one
+// string that is written once the chunk is done
+let batching = false;
+let outgoing = '';
+
+function write(text) {
+  if (batching) {
+    outgoing += text;
+  } else {
+    stdout.write(text);
+  }
+}
+
+// Static results are serialized once at startup; only the request id is
+// spliced in per call, and omitted when absent as JSON.stringify would
+const RESPONSE_PREFIX = '{"jsonrpc":"2.0"';
+
+function serializeResult(result) {
+  return ',"result":' + JSON.stringify(result) + '}\n';
+}
+
+function sendStaticResponse(id, serializedResult) {
+  const idField = id === undefined ? '' : ',"id":' + JSON.stringify(id);
+  write(RESPONSE_PREFIX + idField + serializedResult);
+}
+
+// Emit one newline-delimited JSON-RPC message, skipping console.log's
+// argument formatting
+function sendResponse(response) {
+  write(JSON.stringify(response) + '\n');
+}
+
+// Messages are newline-delimited JSON. stdin is consumed as raw Buffers and
+// only complete lines are decoded and passed to handleLine.
+function listen(handleLine) {
+  let pending = Buffer.alloc(0);
+
+  stdin.on('data', (chunk) => {
+    // Chunks normally end on a message boundary, so they are scanned in place;
+    // only a carried-over partial line forces a copy
+    const data = pending.length > 0 ? Buffer.concat([pending, chunk]) : chunk;
+
+    // 0x0a never occurs inside a multi-byte UTF-8 sequence, so every complete
+    // line in the chunk is decoded at once and split as a string
+    const end = data.lastIndexOf(0x0a);
+    if (end === -1) {
+      pending = data;
+      return;
+    }
+
+    batching = true;
+    for (const line of data.toString('utf8', 0, end).split('\n')) {
+      handleLine(line);
+    }
+    batching = false;
+
+    if (outgoing) {
+      stdout.write(outgoing);
+      outgoing = '';
+    }
+
+    pending = data.subarray(end + 1);
+  });
+
+  stdin.on('end', () => {
+    if (pending.length > 0) {
+      handleLine(pending.toString('utf8'));
+    }
+  });
+}
+
+module.exports = {
+  listen,
+  sendResponse,
+  serializeResult,
+  sendStaticResponse
+};